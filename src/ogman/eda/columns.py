@@ -1,10 +1,57 @@
 import re
 import json
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Iterable, Dict
 import pandas as pd
 
+try:  # optional: faster writing of save_map_to
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["clean_columns"]
+
+_CAMEL1 = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL2 = re.compile(r'([a-z0-9])([A-Z])')
+_WS = re.compile(r'\s+')
+_NONALNUM = re.compile(r'[^a-z0-9_]')
+_MULTI_ = re.compile(r'_+')
+_CANON = re.compile(r'[a-z][a-z0-9_]*\Z')
+_TRANS = str.maketrans('-/', '__')
+_comb = unicodedata.combining
+
+
+def _deaccent(s: str) -> str:
+    s = str(s)
+    # ASCII has nothing to decompose
+    if s.isascii():
+        return s
+    return ''.join(
+        c for c in unicodedata.normalize('NFKD', s)
+        if not _comb(c)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _to_snake_cached(s: str, digit_prefix: str) -> str:
+    # already snake_case -> the pipeline below would return it unchanged
+    if _CANON.match(s) and '__' not in s and not s.endswith('_'):
+        return s
+    s = _deaccent(s).strip()
+    # Camel/PascalCase -> snake_case
+    s = _CAMEL1.sub(r'\1_\2', s)
+    s = _CAMEL2.sub(r'\1_\2', s)
+    s = _WS.sub('_', s.translate(_TRANS))
+    s = _NONALNUM.sub('', s.lower())
+    s = _MULTI_.sub('_', s).strip('_')
+    if not s:
+        s = "col"
+    if s[0].isdigit():
+        s = f"{digit_prefix}{s}"
+    return s
+
 
 def clean_columns(df: pd.DataFrame,
                   overrides: Optional[Dict[str, str]] = None,
@@ -54,27 +101,12 @@ def clean_columns(df: pd.DataFrame,
         Cleaned DataFrame, optionally with the column name mapping.
     """
 
-    def deaccent(s: str) -> str:
-        return ''.join(
-            c for c in unicodedata.normalize('NFKD', str(s))
-            if not unicodedata.combining(c)
-        )
-
-    def to_snake(s: str) -> str:
-        s = deaccent(s).strip()
-        # Camel/PascalCase -> snake_case
-        s = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', s)
-        s = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s)
-        s = s.replace('-', '_').replace('/', '_')
-        s = re.sub(r'\s+', '_', s)
-        s = s.lower()
-        s = re.sub(r'[^a-z0-9_]', '', s)
-        s = re.sub(r'_+', '_', s).strip('_')
-        if not s:
-            s = "col"
-        if s[0].isdigit():
-            s = f"{digit_prefix}{s}"
-        return s
+    # nothing to clean (the empty mapping is still written if requested)
+    if df.columns.empty and not save_map_to:
+        return (df.copy(), {}) if return_mapping else df.copy()
+
+    def to_snake(s) -> str:
+        return _to_snake_cached(str(s), digit_prefix)
 
     def shorten(name: str, keep_for_suffix: int = 0) -> str:
         if max_len is None or len(name) <= max_len:
@@ -82,11 +114,31 @@ def clean_columns(df: pd.DataFrame,
         cut = max_len - keep_for_suffix
         return name[:max(1, cut)]
 
+    def dedupe(base: str, current: Optional[str] = None) -> str:
+        # Candidates are base, base_2, base_3, ...; next_suffix remembers
+        # where the last search for a base stopped (everything before it is
+        # already in `used`), so repeated bases don't rescan from _2.
+        # With `current` set a skipped candidate may be the name being
+        # overridden, so that search starts from _2 again.
+        if base not in used or base == current:
+            return base
+        i = 2 if current is not None else next_suffix.get(base, 2)
+        while True:
+            suf = f"_{i}"
+            s = shorten(base, keep_for_suffix=len(suf)) + suf
+            i += 1
+            if s not in used or s == current:
+                break
+        if current is None:
+            next_suffix[base] = i
+        return s
+
     # 0. MultiIndex -> flat
+    orig_names = list(map(str, df.columns))
     cols_in = (
-        [mi_joiner.join(map(str, t)) for t in df.columns]
+        df.columns.map(lambda t: mi_joiner.join(map(str, t))).tolist()
         if flatten_multiindex and isinstance(df.columns, pd.MultiIndex)
-        else list(map(str, df.columns))
+        else orig_names
     )
 
     # 1. reserved (minimum set)
@@ -94,23 +146,19 @@ def clean_columns(df: pd.DataFrame,
     if extra_reserved:
         reserved |= set(map(str, extra_reserved))
 
-    mapping, used = {}, set()
+    mapping, used, next_suffix = {}, set(), {}
 
     # 2. cleaning + anti-collisions + uniqueness
-    for orig, raw in zip(map(str, df.columns), cols_in):
-        s = to_snake(raw)
+    # (raw is already a str, so the to_snake wrapper is skipped in this loop)
+    snake, used_add = _to_snake_cached, used.add
+    for orig, raw in zip(orig_names, cols_in):
+        s = snake(raw, digit_prefix)
         base = s
         while s in reserved:
             s = f"{base}{conflict_suffix}"
             base = s
-        s = shorten(s)
-        base = s
-        i = 2
-        while s in used:
-            suf = f"_{i}"
-            s = shorten(base, keep_for_suffix=len(suf)) + suf
-            i += 1
-        used.add(s)
+        s = dedupe(shorten(s))
+        used_add(s)
         mapping[orig] = s
 
     df2 = df.rename(columns=mapping)
@@ -118,7 +166,6 @@ def clean_columns(df: pd.DataFrame,
     # 3. overrides (after cleaning)
     if overrides:
         cleaned_over = {}
-        inv = {v: k for k, v in mapping.items()}
         for orig_name, wanted in overrides.items():
             current = mapping.get(orig_name, to_snake(orig_name))
             vv = to_snake(wanted)
@@ -126,12 +173,7 @@ def clean_columns(df: pd.DataFrame,
             while vv in reserved:
                 vv = f"{base}{conflict_suffix}"
                 base = vv
-            base = vv
-            i = 2
-            while vv in (used - {current}):
-                suf = f"_{i}"
-                vv = shorten(base, keep_for_suffix=len(suf)) + suf
-                i += 1
+            vv = dedupe(vv, current)
             used.add(vv)
             cleaned_over[current] = vv
             if orig_name in mapping:
@@ -140,7 +182,10 @@ def clean_columns(df: pd.DataFrame,
 
     if save_map_to:
         Path(save_map_to).parent.mkdir(parents=True, exist_ok=True)
-        with open(save_map_to, "w", encoding="utf-8") as f:
-            json.dump(mapping, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            Path(save_map_to).write_bytes(orjson.dumps(mapping, option=orjson.OPT_INDENT_2))
+        else:
+            with open(save_map_to, "w", encoding="utf-8", newline="\n") as f:
+                json.dump(mapping, f, ensure_ascii=False, indent=2)
 
     return (df2, mapping) if return_mapping else df2
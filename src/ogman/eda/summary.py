@@ -1,5 +1,24 @@
+import numpy as np
 import pandas as pd
 
+# Kolejność kolumn
+_COLUMN_ORDER = [
+    "dtype",
+    "logical_type",
+    "nunique",
+    "missing",
+    "missing [%]",
+    "duplicates",
+    "duplicates [%]",
+    "min",
+    "max",
+    "mean",
+    "top_values",
+    "min_date",
+    "max_date"
+]
+
+
 def summarize_df(df: pd.DataFrame, top_n: int = 3) -> pd.DataFrame:
     """
     Generate an extended EDA summary of a DataFrame (preserves column order).
@@ -27,69 +46,94 @@ def summarize_df(df: pd.DataFrame, top_n: int = 3) -> pd.DataFrame:
         Data summary table with key statistics per column.
     """
 
-    n_rows = len(df)
-    summary = pd.DataFrame({
-        "dtype": df.dtypes.astype(str),
-        "nunique": df.nunique(dropna=False),
-        "missing": df.isna().sum(),
-        "missing [%]": (df.isna().mean() * 100).round(2),
-    }, index=df.columns)
+    # Brak kolumn -> pusta tabela (z tymi samymi dtype co pełna ścieżka),
+    # bez liczenia statystyk
+    if df.columns.empty:
+        empty = {col: pd.Series(index=df.columns, dtype="float64") for col in _COLUMN_ORDER[:10]}
+        empty["dtype"] = df.dtypes.astype(str)
+        empty["duplicates"] = pd.Series(index=df.columns, dtype="int64")
+        return pd.DataFrame(empty, index=df.columns)
 
-    # Duplikaty per kolumna
-    dup_counts = df.columns.to_series().apply(lambda c: df[c].duplicated(keep=False).sum())
-    dup_perc = (dup_counts / n_rows * 100).round(2)
-    summary["duplicates"] = dup_counts
-    summary["duplicates [%]"] = dup_perc
-
-    # Typ logiczny kolumny
-    def logical_type(s: pd.Series) -> str:
-        if pd.api.types.is_numeric_dtype(s):
+    # Typ logiczny kolumny (raz na dtype, nie na kolumnę)
+    def logical_type(dtype) -> str:
+        if pd.api.types.is_numeric_dtype(dtype):
             return "numeric"
-        elif pd.api.types.is_bool_dtype(s):
+        elif pd.api.types.is_bool_dtype(dtype):
             return "boolean"
-        elif pd.api.types.is_datetime64_any_dtype(s):
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
             return "datetime"
-        elif pd.api.types.is_object_dtype(s):
-            nunique = s.nunique(dropna=True)
-            return "categorical" if nunique <= 10 else "text"
+        elif pd.api.types.is_object_dtype(dtype):
+            return "object"
         return "other"
 
-    summary["logical_type"] = [logical_type(df[col]) for col in df.columns]
+    by_dtype = {dtype: logical_type(dtype) for dtype in set(df.dtypes)}
+    logical = np.array([by_dtype[dtype] for dtype in df.dtypes], dtype=object)
+    is_obj = logical == "object"
+
+    # Unikalne wartości: kolumny object hashujemy raz (unique()) i z tego
+    # liczymy zarówno nunique(dropna=False), jak i dropna=True dla typu logicznego
+    nunique = np.empty(len(df.columns), dtype="int64")
+    nunique[~is_obj] = df.iloc[:, np.flatnonzero(~is_obj)].nunique(dropna=False).to_numpy()
+    obj_pos = np.flatnonzero(is_obj)
+    obj_nunique = np.empty(len(obj_pos), dtype="int64")
+    for k, pos in enumerate(obj_pos):
+        uniq = df.iloc[:, pos].unique()
+        nunique[pos] = len(uniq)
+        obj_nunique[k] = len(uniq) - pd.isna(uniq).sum()
+    nunique = pd.Series(nunique, index=df.columns)
+
+    # object -> categorical / text
+    if len(obj_pos):
+        logical[is_obj] = np.where(obj_nunique <= 10, "categorical", "text")
+
+    # Kolumny zbieramy w słowniku i budujemy tabelę raz, na końcu
+    n_rows = len(df)
+    na_sum = df.isna().sum()
+    data = {
+        "dtype": df.dtypes.astype(str),
+        "logical_type": logical.tolist(),
+        "nunique": nunique,
+        "missing": na_sum,
+        "missing [%]": (na_sum / n_rows * 100).round(2),
+    }
+
+    # Duplikaty per kolumna
+    # (kolumny z samymi unikalnymi wartościami mają 0, stałe mają n_rows,
+    # duplicated() liczymy tylko dla pozostałych)
+    dup_counts = pd.Series(0, index=df.columns, dtype="int64")
+    dup_counts[(nunique == 1) & (n_rows > 1)] = n_rows
+    rest = (nunique > 1) & (nunique < n_rows)
+    if rest.any():
+        dup_counts[rest] = [df[c].duplicated(keep=False).sum() for c in df.columns[rest]]
+    data["duplicates"] = dup_counts
+    data["duplicates [%]"] = (dup_counts / n_rows * 100).round(2)
 
     # Statystyki dla liczb
     num_cols = df.select_dtypes(include="number")
-    summary.loc[num_cols.columns, "min"] = num_cols.min()
-    summary.loc[num_cols.columns, "max"] = num_cols.max()
-    summary.loc[num_cols.columns, "mean"] = num_cols.mean().round(2)
+    num_min, num_max = num_cols.min(), num_cols.max()
+    # min/max z kolumn int (numpy) jako float64, tak jak wcześniej
+    if isinstance(num_min.dtype, np.dtype) and num_min.dtype.kind in "iu":
+        num_min, num_max = num_min.astype("float64"), num_max.astype("float64")
+    data["min"] = num_min
+    data["max"] = num_max
+    data["mean"] = num_cols.mean().round(2)
 
     # Top wartości dla kategorii
-    cat_cols = summary.query("logical_type == 'categorical'").index
-    for col in cat_cols:
-        top_values = df[col].value_counts(dropna=False).head(top_n)
-        summary.loc[col, "top_values"] = ", ".join([f"{i}: {v}" for i, v in zip(top_values.index, top_values.values)])
+    cat_cols = df.columns[logical == "categorical"]
+    if len(cat_cols):
+        counts = [df[col].value_counts(dropna=False).head(top_n) for col in cat_cols]
+        data["top_values"] = pd.Series([
+            ", ".join([f"{i}: {v}" for i, v in zip(vc.index, vc.values)]) for vc in counts
+        ], index=cat_cols)
 
     # Zakres dat
-    dt_cols = summary.query("logical_type == 'datetime'").index
-    for col in dt_cols:
-        summary.loc[col, "min_date"] = df[col].min()
-        summary.loc[col, "max_date"] = df[col].max()
-
-    # Kolejność kolumn
-    column_order = [
-        "dtype", 
-        "logical_type",
-        "nunique", 
-        "missing", 
-        "missing [%]",
-        "duplicates", 
-        "duplicates [%]",
-        "min", 
-        "max", 
-        "mean",
-        "top_values", 
-        "min_date", 
-        "max_date"
-    ]
-    summary = summary[[col for col in column_order if col in summary.columns]]
+    dt_cols = df.columns[logical == "datetime"]
+    if len(dt_cols):
+        dt_block = df[dt_cols]
+        data["min_date"] = dt_block.min()
+        data["max_date"] = dt_block.max()
+
+    summary = pd.DataFrame(data, index=df.columns,
+                           columns=[col for col in _COLUMN_ORDER if col in data])
 
     return summary